@@ -22,10 +22,19 @@
 #
 #
 """Simulate a bit (1 or 0) of data"""
-import copy
 
 class bit():
     """Simulation of a single bit"""
+    __slots__ = ("_data",)
+
+    def __new__(cls, parity=False):
+        # hand back a class specialised for the parity setting, so the
+        # hot methods never have to check it. Anything but True counts as
+        # False
+        if cls is bit and parity is True:
+            cls = _parity_checked_bit
+        return super().__new__(cls)
+
     def __init__(self, parity=False):
         """Simulate a single bit
 
@@ -34,61 +43,81 @@ class bit():
 
         For most use cases, leaving parity as False is safe.
         """
-        # set the parity setting. Default to False
-        if isinstance(parity, bool):
-            self._parity= parity
-        else:
-            self._parity= False
+        self._data = False
+
+    def get_bit(self, override_parity=False):
+        """Get current value of bit
+
+        override_parity is accepted for compatibility with bit(parity=True),
+        but there is no parity to check here.
+        """
+        return self._data
+
+    def set_bit(self, data):
+        """Set current value of bit
+
+        No parity checks performed
+        """
+        self._data = bool(data)
+
+    def bit_flip(self, parity=True):
+        """Flip the bit
 
-        if self._parity:
-            self._data = {"data": False, "parity": False}
-        else:
-            self._data = {"data": False}
+        parity is accepted for compatibility with bit(parity=True), but there
+        is no parity copy to update here.
+        """
+        # bool ^ True stays a bool, so get_bit still returns True/False
+        self._data ^= True
 
-        if self._parity:
-            # define parity check if parity is enabled
-            def check_parity():
-                """Manually perform a parity check.
 
-                True if parity is good.
-                Else, False
-                """
-                return self._data["parity"] == self._data["data"]
+class _parity_checked_bit(bit):
+    """Simulation of a single bit, with a parity copy of its value
 
-            self.check_parity = check_parity
+    Returned by bit(parity=True). Use that rather than creating this directly.
+    """
+    __slots__ = ("_parity_mirror",)
+
+    def __init__(self, parity=True):
+        self._data = False
+        self._parity_mirror = False
+
+    def check_parity(self):
+        """Manually perform a parity check.
+
+        True if parity is good.
+        Else, False
+        """
+        return self._parity_mirror == self._data
 
     def get_bit(self, override_parity=False):
         """Get current value of bit
 
-        If parity was set to True, if the parity bit and data bit do not match,
-        a ValueError is raised.
+        If the parity bit and data bit do not match, a ValueError is raised.
 
         Setting override_parity to True bypasses parity checks in order
         to attempt data repair or ignore issues
         """
-        if self._parity and not override_parity:
-            if self._data["data"] == self._data["parity"]:
-                return self._data["data"]
-            raise ValueError("Parity bit does not match Value Bit!")
-        return self._data["data"]
+        if override_parity or self._data == self._parity_mirror:
+            return self._data
+        raise ValueError("Parity bit does not match Value Bit!")
 
     def set_bit(self, data):
-        """Set current value of bit
+        """Set current value of bit, and its parity copy
 
         No parity checks performed
         """
         new_data = bool(data)
-        # bits must be 100% independent of one another. Prevent Pass by Address
-        if self._parity:
-            self._data["parity"] = copy.deepcopy(new_data)
-        self._data["data"] = copy.deepcopy(new_data)
+        # bools are immutable, so sharing the object keeps bits independent
+        self._parity_mirror = new_data
+        self._data = new_data
 
     def bit_flip(self, parity=True):
         """Flip the bit
 
-        Parity in this context means whether to honor the initially set parity
-        setting. This can be useful for simulating cosmic rays and the like.
+        Passing parity=False leaves the parity copy untouched, so the flip
+        shows up as a parity error. This can be useful for simulating cosmic
+        rays and the like.
         """
-        if parity and self._parity:
-            self._data["parity"] = not self._data["parity"]
-        self._data["data"] = not self._data["data"]
+        self._data ^= True
+        if parity:
+            self._parity_mirror ^= True
@@ -22,10 +22,204 @@
 #
 #
 """Simulate a byte of data (8 bits)"""
-from bit import bit
+
+# parity of every possible byte value: 1 if it has an odd number of 1s
+_PARITY_LUT = bytes((bin(each).count("1") & 1) for each in range(256))
+# the byte-level parity bit each value should store: the inverse of the above
+_PARITY_BIT_LUT = bytes((each ^ 1) for each in _PARITY_LUT)
+
+# every possible byte value as a tuple of its bits, bit 0 first
+_BITS_LUT = tuple(tuple(bool((each >> shift) & 1) for shift in range(0, 8))
+                  for each in range(256))
+
+
+def _hamming_checks(nibble):
+    """Get the 4 extended Hamming(8,4) check bits for a 4-bit value
+
+    Bits 0-2 are the Hamming(7,4) parity bits, bit 3 is the overall parity
+    bit that lets double-bit errors be told apart from single-bit ones.
+    """
+    data = [(nibble >> each) & 1 for each in range(0, 4)]
+    checks = data[0] ^ data[1] ^ data[3]
+    checks |= (data[0] ^ data[2] ^ data[3]) << 1
+    checks |= (data[1] ^ data[2] ^ data[3]) << 2
+    checks |= (_PARITY_LUT[nibble] ^ _PARITY_LUT[checks]) << 3
+    return checks
+
+
+# codeword for every 4-bit value: data in bits 0-3, check bits in bits 4-7
+_HAMMING_ENCODE = bytes((each | (_hamming_checks(each) << 4))
+                        for each in range(16))
+
+
+def _hamming_syndrome(word):
+    """Find which bit of a codeword to flip to correct it
+
+    0 means the codeword is valid, 1-8 means bit (N - 1) is wrong, and 0xFF
+    means it is 2 or more bits away from any valid codeword.
+    """
+    for each in _HAMMING_ENCODE:
+        distance = (word ^ each).bit_count()
+        if distance == 0:
+            return 0
+        if distance == 1:
+            return (word ^ each).bit_length()
+    return 0xFF
+
+
+_HAMMING_SYNDROME = bytes(_hamming_syndrome(each) for each in range(256))
+
+# check bits for every possible byte value: low nibble's in bits 0-3, high
+# nibble's in bits 4-7
+_ECC_LUT = bytes(((_HAMMING_ENCODE[each & 0xF] >> 4) |
+                  (_HAMMING_ENCODE[each >> 4] & 0xF0)) for each in range(256))
+
+
+def _hamming_correct(state, ecc, shifts=(0, 4)):
+    """Correct a byte using its Hamming(8,4) check bits
+
+    Returns the corrected (state, ecc) pair. Up to one flipped bit per nibble,
+    in either the data or its check bits, can be corrected. Anything more
+    raises a ValueError.
+
+    shifts picks which nibbles to correct: 0 for bits 0-3, 4 for bits 4-7.
+    The others are left as they are, errors and all.
+    """
+    if _ECC_LUT[state] == ecc:
+        return (state, ecc)
+    for shift in shifts:
+        word = ((state >> shift) & 0xF) | (((ecc >> shift) & 0xF) << 4)
+        fix = _HAMMING_SYNDROME[word]
+        if fix == 0xFF:
+            raise ValueError("Uncorrectable bit error detected!")
+        if fix:
+            fix -= 1
+            if fix < 4:
+                state ^= 1 << (shift + fix)
+            else:
+                ecc ^= 1 << (shift + fix - 4)
+    return (state, ecc)
+
+
+def _parity_levels(parity):
+    """Split a parity level (0-3) into (byte_level, bit_level) flags"""
+    # levels 1 and 3 have byte-level parity, levels 2 and 3 bit-level
+    parity = int(parity)
+    return (bool(parity & 1), bool(parity & 2))
+
+
+def _bit_mask(index):
+    """Get the mask for the data bit at index (0-7, or negative from 7)"""
+    return 1 << range(0, 8)[index]
+
+
+def _check_state(state, ecc, parity_bit, byte_level, bit_level):
+    """Check a byte's data against its check bits and parity bit
+
+    True if parity is good, else False. Errors the Hamming check bits could
+    correct still count as bad parity.
+    """
+    if bit_level:
+        if _ECC_LUT[state] != ecc:
+            return False
+    if byte_level:
+        # odd parity: the parity bit is set when the number of 1s
+        # in the data is even
+        return _PARITY_BIT_LUT[state] == parity_bit
+    return True
+
+
+def _flip_state(state, ecc, parity_bit, mask, byte_level, bit_level):
+    """Flip the data bits in mask, keeping the enabled parity in step
+
+    Returns the new (state, ecc, parity_bit). Passing False for a level
+    leaves that parity untouched, so the flip shows up as an error.
+    """
+    state ^= mask
+    if bit_level:
+        # the check bits are linear in the data, so only update the ones
+        # covering these bits. Rebuilding them from the stored data would
+        # accept any earlier, uncorrected flip as valid.
+        ecc ^= _ECC_LUT[mask]
+    if byte_level:
+        parity_bit ^= _PARITY_LUT[mask]
+    return (state, ecc, parity_bit)
+
+
+def _set_state_bit(state, ecc, parity_bit, index, value, byte_level,
+                   bit_level):
+    """Set the data bit at index to value, keeping parity in step
+
+    Returns the new (state, ecc, parity_bit).
+    """
+    mask = _bit_mask(index)
+    if value:
+        mask &= ~state
+    else:
+        mask &= state
+    if not mask:
+        # nothing changed, so neither does parity
+        return (state, ecc, parity_bit)
+    return _flip_state(state, ecc, parity_bit, mask, byte_level, bit_level)
+
+
+def _read_state_bit(state, ecc, index, correct):
+    """Read the data bit at index
+
+    With correct set, the half of the byte holding index is repaired with
+    _hamming_correct() first. Errors in the other half are left alone, so
+    they only raise once a bit from that half is read.
+
+    Returns the (state, ecc) after any repair, and the bit's value.
+    """
+    index = range(0, 8)[index]
+    if correct:
+        state, ecc = _hamming_correct(state, ecc, (index & 4,))
+    return (state, ecc, bool((state >> index) & 1))
+
+
+def _read_state(state, ecc, parity_bit, byte_level, bit_level):
+    """Check a whole byte before it is read
+
+    With bit-level parity, correctable bit errors are repaired first. Raises
+    a ValueError if the byte-level parity bit does not match after that.
+
+    Returns the (state, ecc) after any repair.
+    """
+    if bit_level:
+        state, ecc = _hamming_correct(state, ecc)
+    if byte_level and _PARITY_BIT_LUT[state] != parity_bit:
+        raise ValueError("Parity issue detected!")
+    return (state, ecc)
+
+
+def check_parity_vec(states):
+    """Compute the parity of many bytes at once.
+
+    states should be bytes-like (bytes, bytearray, array.array("B"), ...) or
+    an iterable of ints from 0-255. Returns bytes of the same length, holding
+    1 for each byte with an odd number of 1s, else 0.
+
+    This is a single bytes.translate() through _PARITY_LUT, so the lookups
+    all happen in C.
+    """
+    return bytes(states).translate(_PARITY_LUT)
+
+
+def recalculate_parity_vec(states):
+    """Compute the byte-level parity bit for many bytes at once.
+
+    Takes the same input as check_parity_vec(). Returns bytes of the same
+    length, holding the parity bit each byte should store: 1 if the byte has
+    an even number of 1s, else 0.
+    """
+    return bytes(states).translate(_PARITY_BIT_LUT)
+
 
 class byte():
     """Simulation of a single byte"""
+    __slots__ = ("_byte_level", "_bit_level", "_state", "_ecc", "_parity_bit")
+
     def __init__(self, parity=1):
         """Simulate a single bit
 
@@ -33,89 +227,108 @@ class byte():
         level 0: no parity what-so-ever, best performance, least stability
         level 1: byte-level parity, adds extra parity bit to the byte.
                  Slightly slower performance.
-        level 2: bit-level parity, compares the data bit to a second bit which
-                 should always be the same. Significantly slower.
+        level 2: bit-level error correction, stores extended Hamming(8,4)
+                 check bits for each half of the byte. Any single flipped
+                 bit per half is corrected on read, two are detected.
+                 Significantly slower.
         level 3: Combined bit- and byte-level parity. Maximum stability, worst
                  performance
 
         For most use cases, leaving parity as 1 is safe.
+
+        Bits are packed into a single int: bit N of self._state is data bit N.
+        With bit-level parity, self._ecc holds the 8 Hamming check bits.
+        Every field is kept below 256 on purpose: CPython caches those ints,
+        so a byte only ever points at shared objects and allocates none of
+        its own. Folding the fields together, or into a ctypes struct, would
+        cost more memory per byte, not less.
         """
-        self._parity = int(parity)
-        count = 8
-        self._data = {"data": []}
-        for each in range(0, count):
-            if self._parity >= 2:
-                self._data["data"].append(bit(parity=True))
-            else:
-                self._data["data"].append(bit())
+        self._byte_level, self._bit_level = _parity_levels(parity)
+        self._state = 0
+        # the check bits for 0 are all 0
+        self._ecc = 0
+        self._parity_bit = 0
 
-        if (self._parity % 2) == 1:
-            if self._parity >= 2:
-                self._data["parity"] = bit(parity=True)
-            else:
-                self._data["parity"] = bit()
+        if self._byte_level:
             # set parity bit to true since 0 is even
-            self._data["parity"].bit_flip()
-
-        if self._parity:
-            # define parity check if parity is enabled
-            def check_parity():
-                """Manually perform a parity check.
-
-                True if parity is good.
-                Else, False
-                """
-                # how do you check parity on a byte?
-                # check number of 1s and 0s
-                num_1s = 0
-                for each in self._data["data"]:
-                    if each.get_bit():
-                        num_1s += 1
-                if (num_1s % 2) == 1:
-                    return not self._data["parity"].get_bit()
-                return self._data["parity"].get_bit()
-
-            self.check_parity = check_parity
-
-            def recalculate_parity():
-                """recalculate parity bit value"""
-                num_1s = 0
-                for each in self._data["data"]:
-                    if each.get_bit():
-                        num_1s += 1
-                if (num_1s % 2) == 1:
-                    self._data["parity"].set_bit(False)
-                else:
-                    self._data["parity"].set_bit(True)
-
-            self.recalculate_parity = recalculate_parity
+            self._parity_bit = 1
+
+    def check_parity(self):
+        """Manually perform a parity check.
+
+        True if parity is good.
+        Else, False
+
+        With parity level 0 there is nothing to check, so this is always True.
+        Errors the Hamming check bits could correct still count as bad parity.
+        """
+        return _check_state(self._state, self._ecc, self._parity_bit,
+                            self._byte_level, self._bit_level)
+
+    def recalculate_parity(self):
+        """recalculate parity bit value
+
+        Does nothing unless byte-level parity (level 1 or 3) is enabled.
+        """
+        if self._byte_level:
+            self._parity_bit = _PARITY_BIT_LUT[self._state]
 
+    @classmethod
+    def batch_from_ints(cls, states, parity=1):
+        """Create a list of bytes from many ints (0-255) at once
+
+        The new bytes are filled in with bulk_set(), so parity for the whole
+        batch is computed in a single pass rather than once per byte.
+        """
+        states = bytes(states)
+        output = [cls(parity=parity) for each in states]
+        bulk_set(output, states)
+        return output
 
     def get_byte(self, override_parity=False):
         """Get state of all bits, excluding parity
 
+        With bit-level parity, correctable bit errors are repaired first.
+
         Setting override_parity to True bypasses parity checks in order
         to attempt data repair or ignore issues
         """
-        if self._parity and not override_parity:
-            if not self.check_parity():
-                raise ValueError("Parity issue detected!")
-        output = []
-        for each in self._data["data"]:
-            output.append(each.get_bit(override_parity=override_parity))
-        return output
+        if not override_parity:
+            self._state, self._ecc = _read_state(
+                self._state, self._ecc, self._parity_bit, self._byte_level,
+                self._bit_level)
+        return list(_BITS_LUT[self._state])
 
     def set_bit(self, index, value):
         """Change a single bit at the given index"""
-        new_value = bool(value)
-        self._data["data"][index].set_bit(value)
-        if self._parity:
-            self.recalculate_parity()
+        self._state, self._ecc, self._parity_bit = _set_state_bit(
+            self._state, self._ecc, self._parity_bit, index, value,
+            self._byte_level, self._bit_level)
 
     def get_bit(self, index, override_parity=False):
-        """get the value of a single bit at a given index"""
-        op = bool(override_parity)
-        return self._data["data"][index].get_bit(override_parity=op)
+        """get the value of a single bit at a given index
+
+        With bit-level parity, correctable bit errors in the half of the byte
+        holding index are repaired first. Errors in the other half are left
+        alone, so they only raise once a bit from that half is read.
+        """
+        correct = self._bit_level and not override_parity
+        self._state, self._ecc, value = _read_state_bit(
+            self._state, self._ecc, index, correct)
+        return value
+
+    def bit_flip(self, index, parity=True):
+        """Flip the bit at the given index
+
+        Parity in this context means whether to honor the initially set parity
+        setting. Passing False leaves both the Hamming check bits and
+        byte-level parity bit untouched, which can be useful for simulating
+        cosmic rays and the like.
+        """
+        mask = _bit_mask(index)
+        self._state, self._ecc, self._parity_bit = _flip_state(
+            self._state, self._ecc, self._parity_bit, mask,
+            parity and self._byte_level, parity and self._bit_level)
 
     def set_byte(self, value, endian=True):
         """Set entire byte's data at once.
@@ -127,15 +340,53 @@ class byte():
         little-endian or big-endian format. True is little-endian and the
         default, False is big-endian
         """
-        filler = 8 - len(value)
-        data = []
-        # Fill missing data with 0s
-        for each in range(0, filler):
-            data.append(False)
-        for each in value:
-            if endian:
-                data.insert(0, bool(each))
-            else:
-                data.append(bool(each))
+        if len(value) > 8:
+            raise IndexError("byte can only hold 8 bits")
+        # little-endian puts the last value in bit 0, with any missing bits
+        # filled with 0s at the top. Big-endian pads at the bottom instead.
+        if endian:
+            data = reversed(value)
+        else:
+            data = value
+        state = 0
         for each in enumerate(data):
-            self.set_bit(each[0], each[1])
+            if each[1]:
+                state |= 1 << each[0]
+        if not endian:
+            state <<= 8 - len(value)
+        self.set_int(state)
+
+    def set_int(self, value):
+        """Set entire byte's data at once from an int (0-255)
+
+        Bit N of value becomes bit N of the byte.
+        """
+        value = int(value)
+        if not 0 <= value <= 255:
+            raise ValueError("byte can only hold values 0-255")
+        self._state = value
+        if self._bit_level:
+            self._ecc = _ECC_LUT[value]
+        if self._byte_level:
+            self.recalculate_parity()
+
+
+def bulk_set(targets, states):
+    """Set the data of many bytes at once
+
+    targets is a list of bytes, states a matching sequence of ints (0-255)
+    with one value per byte. Parity and check bits for every target are
+    looked up for the whole batch up front, with one bytes.translate() each.
+    """
+    states = bytes(states)
+    if len(targets) != len(states):
+        raise ValueError("Need exactly one state per target byte!")
+    parities = states.translate(_PARITY_BIT_LUT)
+    checks = states.translate(_ECC_LUT)
+    for target, state, parity_bit, ecc in zip(targets, states, parities,
+                                              checks):
+        target._state = state
+        if target._byte_level:
+            target._parity_bit = parity_bit
+        if target._bit_level:
+            target._ecc = ecc
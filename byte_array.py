@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  byte_array.py
+#
+#  Copyright 2022 Thomas Castleman <contact@draugeros.org>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+"""Simulate a contiguous run of bytes"""
+from byte import (_BITS_LUT, _ECC_LUT, _PARITY_BIT_LUT, _bit_mask,
+                  _check_state, _flip_state, _parity_levels, _read_state,
+                  _read_state_bit, _set_state_bit, recalculate_parity_vec)
+
+class byte_array():
+    """Simulation of many bytes, stored side by side"""
+    __slots__ = ("_byte_level", "_bit_level", "_states", "_parity_bits",
+                 "_ecc")
+
+    def __init__(self, size, parity=1):
+        """Simulate size bytes
+
+        Parity levels are the same as for a single byte:
+        level 0: no parity what-so-ever, best performance, least stability
+        level 1: byte-level parity, adds extra parity bit to each byte.
+        level 2: bit-level error correction, stores extended Hamming(8,4)
+                 check bits for each half of every byte. Any single flipped
+                 bit per half is corrected on read, two are detected.
+        level 3: Combined bit- and byte-level parity.
+
+        Rather than one object per byte, every field is kept in its own
+        bytearray: data, byte-level parity bits and Hamming check bits each
+        take a single byte per simulated byte.
+        """
+        self._byte_level, self._bit_level = _parity_levels(parity)
+        self._states = bytearray(size)
+        self._parity_bits = None
+        self._ecc = None
+        if self._byte_level:
+            self._parity_bits = bytearray([_PARITY_BIT_LUT[0]]) * size
+        if self._bit_level:
+            self._ecc = bytearray([_ECC_LUT[0]]) * size
+
+    def __len__(self):
+        return len(self._states)
+
+    def _load(self, index):
+        """Get (state, ecc, parity_bit) for the byte at index
+
+        Fields for disabled parity levels read as 0.
+        """
+        ecc = 0
+        parity_bit = 0
+        if self._bit_level:
+            ecc = self._ecc[index]
+        if self._byte_level:
+            parity_bit = self._parity_bits[index]
+        return (self._states[index], ecc, parity_bit)
+
+    def _store(self, index, state, ecc, parity_bit):
+        """Write (state, ecc, parity_bit) back to the byte at index
+
+        Fields for disabled parity levels are ignored.
+        """
+        self._states[index] = state
+        if self._bit_level:
+            self._ecc[index] = ecc
+        if self._byte_level:
+            self._parity_bits[index] = parity_bit
+
+    def check_parity(self, index):
+        """Manually perform a parity check on the byte at index.
+
+        True if parity is good.
+        Else, False
+
+        Errors the Hamming check bits could correct still count as bad parity.
+        """
+        return _check_state(*self._load(index), self._byte_level,
+                            self._bit_level)
+
+    def check_parity_all(self):
+        """Manually perform a parity check on every byte at once.
+
+        True if parity is good for all bytes.
+        Else, False
+        """
+        if self._bit_level:
+            if self._states.translate(_ECC_LUT) != self._ecc:
+                return False
+        if self._byte_level:
+            expected = self._states.translate(_PARITY_BIT_LUT)
+            return expected == self._parity_bits
+        return True
+
+    def get_byte(self, index, override_parity=False):
+        """Get state of all bits of the byte at index, excluding parity
+
+        With bit-level parity, correctable bit errors are repaired first.
+
+        Setting override_parity to True bypasses parity checks in order
+        to attempt data repair or ignore issues
+        """
+        if not override_parity:
+            fields = self._load(index)
+            state, ecc = _read_state(*fields, self._byte_level,
+                                     self._bit_level)
+            self._store(index, state, ecc, fields[2])
+        return list(_BITS_LUT[self._states[index]])
+
+    def set_bit(self, index, bit_index, value):
+        """Change a single bit of the byte at index"""
+        self._store(index, *_set_state_bit(*self._load(index), bit_index,
+                                           value, self._byte_level,
+                                           self._bit_level))
+
+    def get_bit(self, index, bit_index, override_parity=False):
+        """get the value of a single bit of the byte at index
+
+        With bit-level parity, correctable bit errors in the half of the byte
+        holding bit_index are repaired first. Errors in the other half are
+        left alone, so they only raise once a bit from that half is read.
+        """
+        fields = self._load(index)
+        correct = self._bit_level and not override_parity
+        state, ecc, value = _read_state_bit(fields[0], fields[1], bit_index,
+                                            correct)
+        self._store(index, state, ecc, fields[2])
+        return value
+
+    def bit_flip(self, index, bit_index, parity=True):
+        """Flip a single bit of the byte at index
+
+        Parity in this context means whether to honor the initially set parity
+        setting. Passing False leaves both the Hamming check bits and
+        byte-level parity bit untouched, which can be useful for simulating
+        cosmic rays and the like.
+        """
+        mask = _bit_mask(bit_index)
+        self._store(index, *_flip_state(*self._load(index), mask,
+                                        parity and self._byte_level,
+                                        parity and self._bit_level))
+
+    def bulk_set(self, states, start=0):
+        """Set the data of many bytes at once, beginning at start
+
+        states is a sequence of ints (0-255). Parity bits for the whole run
+        are computed in a single pass using recalculate_parity_vec().
+        """
+        states = bytes(states)
+        end = start + len(states)
+        if start < 0 or end > len(self._states):
+            raise IndexError("byte_array index out of range")
+        self._states[start:end] = states
+        if self._bit_level:
+            self._ecc[start:end] = states.translate(_ECC_LUT)
+        if self._byte_level:
+            self._parity_bits[start:end] = recalculate_parity_vec(states)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  test_byte.py
+#
+#  Copyright 2022 Thomas Castleman <contact@draugeros.org>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+"""Check bit-level error correction in byte"""
+import unittest
+
+from byte import byte
+
+class test_hamming(unittest.TestCase):
+    """Hamming(8,4) correction at parity levels 2 and 3"""
+    def _make(self, parity, value):
+        """Get a byte holding value, with good parity"""
+        new = byte(parity=parity)
+        new.set_int(value)
+        return new
+
+    def test_single_flip_corrected(self):
+        """Any one flipped data or check bit is repaired on read"""
+        for parity in (2, 3):
+            for value in range(256):
+                expected = [bool((value >> each) & 1) for each in range(8)]
+                for flip in range(16):
+                    with self.subTest(parity=parity, value=value, flip=flip):
+                        new = self._make(parity, value)
+                        if flip < 8:
+                            new.bit_flip(flip, parity=False)
+                        else:
+                            new._ecc ^= 1 << (flip - 8)
+                        self.assertFalse(new.check_parity())
+                        self.assertEqual(new.get_byte(), expected)
+                        self.assertTrue(new.check_parity())
+
+    def test_double_flip_raises(self):
+        """Two flipped bits in one nibble cannot be corrected"""
+        for parity in (2, 3):
+            for value in range(256):
+                for shift in (0, 4):
+                    with self.subTest(parity=parity, value=value,
+                                      shift=shift):
+                        new = self._make(parity, value)
+                        new.bit_flip(shift, parity=False)
+                        new.bit_flip(shift + 1, parity=False)
+                        with self.assertRaisesRegex(
+                                ValueError,
+                                "Uncorrectable bit error detected!"):
+                            new.get_byte()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+#  test_byte_array.py
+#
+#  Copyright 2022 Thomas Castleman <contact@draugeros.org>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+#
+"""Check byte_array against byte"""
+import random
+import unittest
+
+from byte import byte
+from byte_array import byte_array
+
+class test_byte_array(unittest.TestCase):
+    """byte_array at every parity level"""
+    def test_bulk_set_bounds(self):
+        """Runs starting before 0 or ending past the end are rejected"""
+        for parity in range(4):
+            with self.subTest(parity=parity):
+                new = byte_array(8, parity=parity)
+                with self.assertRaises(IndexError):
+                    new.bulk_set(b"\x01", start=-1)
+                with self.assertRaises(IndexError):
+                    new.bulk_set(b"\x01\x02", start=7)
+                with self.assertRaises(IndexError):
+                    new.bulk_set(bytes(9))
+                # nothing was written by the rejected calls
+                self.assertEqual(new._states, bytearray(8))
+                new.bulk_set(b"\x01\x02", start=6)
+                self.assertEqual(new.get_byte(7), _bits_of(2))
+                self.assertTrue(new.check_parity_all())
+
+    def test_check_parity_all_after_flip(self):
+        """An unrecorded flip fails check_parity_all, a recorded one passes"""
+        for parity in (1, 2, 3):
+            with self.subTest(parity=parity):
+                new = byte_array(64, parity=parity)
+                new.bulk_set(range(64))
+                self.assertTrue(new.check_parity_all())
+                new.bit_flip(10, 3, parity=False)
+                self.assertFalse(new.check_parity_all())
+                self.assertFalse(new.check_parity(10))
+                self.assertTrue(new.check_parity(11))
+                new.bit_flip(10, 3, parity=False)
+                self.assertTrue(new.check_parity_all())
+                new.bit_flip(10, 3)
+                self.assertTrue(new.check_parity_all())
+
+    def test_matches_byte(self):
+        """The same writes give the same reads as a list of bytes"""
+        rng = random.Random(0)
+        for parity in range(4):
+            with self.subTest(parity=parity):
+                new = byte_array(16, parity=parity)
+                expected = [byte(parity=parity) for each in range(16)]
+                for each in range(500):
+                    index = rng.randrange(16)
+                    bit_index = rng.randrange(-8, 8)
+                    value = rng.random() < 0.5
+                    new.set_bit(index, bit_index, value)
+                    expected[index].set_bit(bit_index, value)
+                    self.assertEqual(new.get_bit(index, bit_index),
+                                     expected[index].get_bit(bit_index))
+                for index in range(16):
+                    self.assertEqual(new.get_byte(index),
+                                     expected[index].get_byte())
+                    self.assertTrue(new.check_parity(index))
+                self.assertTrue(new.check_parity_all())
+
+
+def _bits_of(value):
+    """Get the bits of value as get_byte() returns them"""
+    return [bool((value >> each) & 1) for each in range(8)]
+
+
+if __name__ == "__main__":
+    unittest.main()